@@ -29,7 +29,7 @@ setuptools.setup(
         'pytest11': ['firefly=firefly.plugins.pytest']
     },
     install_requires=[
-        'aiohttp>=3.5.4',
+        'aiohttp>=3.8.0',
         'aiohttp-cors>=0.7.0',
         'dateparser>=0.7.4',
         'dirsync>=2.2.3',
@@ -46,6 +46,7 @@ setuptools.setup(
     ],
     extras_require={
         'OpenApi Generation': ['apispec>=3.3.0', 'docstring_parser>=0.7.1'],
+        'Fast Event Loop': ['uvloop>=0.14.0'],
     },
     packages=setuptools.PEP420PackageFinder.find('src'),
     package_dir={'': 'src'},
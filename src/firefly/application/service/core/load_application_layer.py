@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 import typing
 from pprint import pprint
 from typing import List, Type
@@ -58,13 +57,14 @@ class LoadApplicationLayer(ffd.ApplicationService):
             if cls.has_annotations():
                 for annotation in cls.get_annotations():
                     annotation.configure(cls, context.container)
-            if issubclass(cls, ffd.ApplicationService):
+            mro = cls.__mro__
+            if ffd.ApplicationService in mro:
                 self._register_service(cls, context)
                 self._add_endpoints(cls, context)
-            elif issubclass(cls, ffd.Middleware):
+            elif ffd.Middleware in mro:
                 self._add_middleware(cls, context)
         for entity in context.entities:
-            if issubclass(entity, ffd.AggregateRoot):
+            if ffd.AggregateRoot in entity.__mro__:
                 self._add_endpoints(entity, context)
 
     def _add_middleware(self, cls: Type[ffd.Middleware], context: ffd.Context):
@@ -187,14 +187,8 @@ class LoadApplicationLayer(ffd.ApplicationService):
         except (ModuleNotFoundError, KeyError):
             return []
 
-        ret = []
-        for k, v in module.__dict__.items():
-            if not inspect.isclass(v):
-                continue
-            if issubclass(v, (ffd.ApplicationService, ffd.Middleware, ffd.MetaAware)):
-                ret.append(v)
-
-        return ret
+        bases = (ffd.ApplicationService, ffd.Middleware, ffd.MetaAware)
+        return [v for v in ffd.get_module_classes(module) if any(b in v.__mro__ for b in bases)]
 
     @staticmethod
     def _generate_message_name(cls):
@@ -26,6 +26,7 @@ class LoadContainers(ffd.ApplicationService):
 
     def __call__(self):
         self.debug('LoadContainers called')
+        initialized = []
         for context in self._context_map.contexts:
             self.debug(f'Checking context "{context.name}"')
             if context.name == 'firefly':
@@ -34,7 +35,8 @@ class LoadContainers(ffd.ApplicationService):
                 context.container = self._load_module(context.name, context.config)
                 self.debug(f'Loaded container: {context.container}')
                 self._container.register_container(context.container)
-            self.dispatch(ffd.ContainerInitialized(context=context.name))
+            initialized.append(ffd.ContainerInitialized(context=context.name))
+        self.batched_dispatch(initialized)
 
         self.debug('All containers are built. Looping through again to link them all together.')
         for context in self._context_map.contexts:
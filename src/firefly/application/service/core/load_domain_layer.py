@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 
 import firefly.domain as ffd
 import inflection
@@ -42,15 +41,15 @@ class LoadDomainLayer(ffd.ApplicationService):
         except (ModuleNotFoundError, KeyError):
             return
 
-        for k, v in module.__dict__.items():
-            if not inspect.isclass(v):
-                continue
-            if issubclass(v, ffd.Entity):
+        entity, value_object, domain_service = ffd.Entity, ffd.ValueObject, ffd.DomainService
+        for v in ffd.get_module_classes(module):
+            mro = v.__mro__
+            if entity in mro:
                 v._logger = self._logger
                 context.entities.append(v)
-            elif issubclass(v, ffd.ValueObject):
+            elif value_object in mro:
                 v._logger = self._logger
-            elif issubclass(v, ffd.DomainService) and v is not ffd.DomainService:
+            elif domain_service in mro and v is not domain_service:
                 v._logger = self._logger
                 v._system_bus = self._system_bus
                 name = inflection.underscore(v.__name__)
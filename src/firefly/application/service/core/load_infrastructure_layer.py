@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 from typing import List, Type
 
 import firefly.domain as ffd
@@ -55,11 +54,4 @@ class LoadInfrastructureLayer(ffd.ApplicationService):
         except (ModuleNotFoundError, KeyError):
             return []
 
-        ret = []
-        for k, v in module.__dict__.items():
-            if not inspect.isclass(v):
-                continue
-            if issubclass(v, ffd.MetaAware):
-                ret.append(v)
-
-        return ret
+        return [v for v in ffd.get_module_classes(module) if ffd.MetaAware in v.__mro__]
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 import importlib
-import inspect
 from typing import List
 
 import firefly.domain as ffd
@@ -39,11 +38,4 @@ class LoadPresentationLayer(ffd.ApplicationService):
         except (ModuleNotFoundError, KeyError):
             return []
 
-        ret = []
-        for k, v in module.__dict__.items():
-            if not inspect.isclass(v):
-                continue
-            if hasattr(v, '__ff_port'):
-                ret.append(v)
-
-        return ret
+        return [v for v in ffd.get_module_classes(module) if hasattr(v, '__ff_port')]
@@ -14,9 +14,13 @@
 
 from __future__ import annotations
 
+# __pragma__('skip')
+from typing import AsyncIterable, Union
+# __pragma__('noskip')
+
 from firefly.domain.entity.entity import optional
 from firefly.domain.entity.messaging.response import Response
 
 
 class HttpResponse(Response):
-    body: str = optional(str)
+    body: Union[str, AsyncIterable] = optional()
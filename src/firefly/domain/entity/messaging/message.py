@@ -57,7 +57,7 @@ class Message(FireflyType, metaclass=MessageMeta):
             if self.__class__._context is not None:
                 self._context = self.__class__._context
             else:
-                self._context = self.__module__.split('.')[0]
+                self._context = self.__class__._module_context
 
     # noinspection PyDataclass
     def to_dict(self, recursive: bool = True) -> dict:
@@ -30,6 +30,7 @@ from firefly.presentation.web.polyfills import ABC
 
 class FireflyType(ContextAware, ABC):
     _context: str = None
+    _str_cache = None
 
     def __str__(self):
         try:
@@ -39,19 +40,26 @@ class FireflyType(ContextAware, ABC):
         except AttributeError:
             context = self._context
 
-        return f'{context}.{self.__class__.__name__}' \
+        # The context can be reassigned after construction (see CrudOperation), so the cache is keyed on it.
+        cached = self._str_cache
+        if cached is not None and cached[0] == context:
+            return cached[1]
+
+        ret = f'{context}.{self.__class__.__name__}' \
             if context is not None else self.__class__.__name__
+        object.__setattr__(self, '_str_cache', (context, ret))
+
+        return ret
 
     def __repr__(self):
         return str(self)
 
     def is_this(self, this_: typing.Any):
-        if isinstance(this_, str) and this_ == str(self):
-            return True
-        try:
-            return isinstance(self, this_) and self.__class__.__name__ == this_.__name__
-        except TypeError:
+        if isinstance(this_, str):
+            return this_ == str(self)
+        if not isinstance(this_, type):
             return False
+        return self.__class__.__name__ == this_.__name__ and isinstance(self, this_)
 
     def get_context(self):
         return self._context
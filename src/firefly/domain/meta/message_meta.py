@@ -50,6 +50,7 @@ class MessageMeta(ABCMeta):
                 my_dict['__annotations__'] = kwargs['annotations_']
 
         ret = type.__new__(mcs, name, bases, my_dict)
+        ret._module_context = ret.__module__.split('.')[0]
 
         return dataclass(ret, eq=False, repr=False)
 
@@ -22,6 +22,7 @@ from .application_service import ApplicationService
 from ...value_object.generic_base import GenericBase
 
 T = TypeVar('T')
+_MISSING = object()
 
 
 class QueryService(Generic[T], GenericBase, ApplicationService):
@@ -30,33 +31,31 @@ class QueryService(Generic[T], GenericBase, ApplicationService):
     _context: str = None
 
     def __call__(self, **kwargs):
-        try:
-            if self._type().id_name() in kwargs:
-                return self._registry(self._type()).find(kwargs[self._type().id_name()]).to_dict(
-                    force_all=self._kernel.is_admin(self._context)
-                )
-        except KeyError:
-            raise ffd.MissingArgument(self._type().id_name())
+        type_ = self._type()
+        force_all = self._kernel.is_admin(self._context)
+        repository = self._registry(type_)
 
-        limit = None
-        offset = None
-        if 'limit' in kwargs and 'offset' in kwargs:
-            limit = int(kwargs.get('limit'))
-            offset = int(kwargs.get('offset'))
+        id_ = kwargs.get(type_.id_name(), _MISSING)
+        if id_ is not _MISSING:
+            return repository.find(id_).to_dict(force_all=force_all)
 
-        entities = self._registry(self._type())
+        limit = kwargs.get('limit')
+        offset = kwargs.get('offset')
+        if limit is not None and offset is not None:
+            limit = int(limit)
+            offset = int(offset)
+        else:
+            limit = offset = None
 
-        if 'criteria' in kwargs:
-            criteria = kwargs.get('criteria')
+        criteria = kwargs.get('criteria')
+        if criteria is not None:
             if isinstance(criteria, str):
                 criteria = self._serializer.deserialize(criteria)
             criteria = ffd.BinaryOp.from_dict(criteria)
-            if '__include_deleted' not in kwargs and hasattr(self._type(), 'deleted_on'):
-                criteria &= ffd.Attr('deleted_on').is_none()
-            entities = self._registry(self._type()).filter(criteria)
-        elif '__include_deleted' not in kwargs and hasattr(self._type(), 'deleted_on'):
-            criteria = ffd.Attr('deleted_on').is_none()
-            entities = self._registry(self._type()).filter(criteria)
+        if '__include_deleted' not in kwargs and hasattr(type_, 'deleted_on'):
+            not_deleted = ffd.Attr('deleted_on').is_none()
+            criteria = not_deleted if criteria is None else criteria & not_deleted
+        entities = repository.filter(criteria) if criteria is not None else repository
 
         paginated = False
         count = None
@@ -73,7 +72,7 @@ class QueryService(Generic[T], GenericBase, ApplicationService):
                 'offset': offset,
                 'limit': limit,
                 'count': count,
-                'data': list(map(lambda e: e.to_dict(force_all=self._kernel.is_admin(self._context)), entities)),
+                'data': [e.to_dict(force_all=force_all) for e in entities],
             }
 
-        return list(map(lambda e: e.to_dict(force_all=self._kernel.is_admin(self._context)), entities))
+        return [e.to_dict(force_all=force_all) for e in entities]
@@ -68,6 +68,9 @@ class Logger(ABC):
     def set_level(self, level: any):
         pass
 
+    def is_debug_enabled(self) -> bool:
+        return True
+
 
 class LoggerAware:
     _logger: Logger = None
@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from typing import Union
+from typing import List, Union
 
 # __pragma__('skip')
 from abc import ABC
@@ -38,9 +38,17 @@ class EventBus(MessageBus):
             event = self._message_factory.event(event, data or {})
         return super().dispatch(event)
 
+    def batched_dispatch(self, events: List[Union[ffd.Event, str]]) -> list:
+        return self.dispatch_many([
+            self._message_factory.event(event, {}) if isinstance(event, str) else event for event in events
+        ])
+
 
 class EventBusAware(ABC):
     _event_bus: EventBus = None
 
     def dispatch(self, event: Union[ffd.Event, str], data: dict = None):
         return self._event_bus.dispatch(event, data)
+
+    def batched_dispatch(self, events: List[Union[ffd.Event, str]]) -> list:
+        return self._event_bus.batched_dispatch(events)
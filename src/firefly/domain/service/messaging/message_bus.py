@@ -58,6 +58,9 @@ class MessageBus:
     def dispatch(self, message: ffd.Message):
         return self._handle(message)
 
+    def dispatch_many(self, messages: List[ffd.Message]) -> list:
+        return self._handle.handle_many(messages)
+
 
 class MessageBusAware(ABC):
     _bus: MessageBus = None
@@ -49,13 +49,20 @@ class MiddlewareStack:
         return False
 
     def __call__(self, msg: ffd.Message):
+        return self._build()(msg)
+
+    def handle_many(self, messages: List[ffd.Message]) -> list:
+        handle = self._build()
+        return [handle(message) for message in messages]
+
+    def _build(self) -> Callable:
         def cb(message, *args, **kwargs):
             return message
 
         for m in reversed(self._middleware):
             cb = self._nest(cb, m)
 
-        return cb(msg)
+        return cb
 
     @staticmethod
     def _nest(cb: Callable, middleware: Middleware):
@@ -14,7 +14,7 @@
 
 from __future__ import annotations
 
-from typing import Union, Callable
+from typing import Callable, List, Union
 
 import firefly.domain as ffd
 
@@ -58,6 +58,9 @@ class SystemBusAware:
     def dispatch(self, event: Union[ffd.Event, str], data: dict = None):
         return self._system_bus.dispatch(event, data)
 
+    def batched_dispatch(self, events: List[Union[ffd.Event, str]]) -> list:
+        return self._system_bus.batched_dispatch(events)
+
     def invoke(self, command: Union[ffd.Command, str], data: dict = None, async_: bool = False):
         return self._system_bus.invoke(command, data, async_=async_)
 
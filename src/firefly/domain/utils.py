@@ -60,6 +60,21 @@ def load_class(fqn: str):
         return None
 
 
+_module_classes = {}
+
+
+def get_module_classes(module) -> typing.List[type]:
+    try:
+        return _module_classes[module]
+    except KeyError:
+        pass
+
+    ret = [v for v in module.__dict__.values() if isinstance(v, type)]
+    _module_classes[module] = ret
+
+    return ret
+
+
 def generate_dc(base: type, _cls, **kwargs):
     if 'eq' not in kwargs:
         kwargs['eq'] = False
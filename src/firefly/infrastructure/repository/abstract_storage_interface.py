@@ -33,6 +33,7 @@ class AbstractStorageInterface(ffd.LoggerAware, ABC):
     _serializer: ffd.Serializer = None
     _registry: ffd.Registry = None
     _cache: dict = {}
+    _reflection_cache: dict = None
 
     def disconnect(self):
         self._disconnect()
@@ -74,13 +75,17 @@ class AbstractStorageInterface(ffd.LoggerAware, ABC):
         if not isinstance(entity, list):
             entities = [entity]
 
+        updates = []
         for entity in entities:
             if hasattr(entity, 'deleted_on') and not force:
                 entity.deleted_on = datetime.now()
-                self.update(entity)
+                updates.append(entity)
             else:
                 deletions.append(entity)
 
+        if len(updates) > 0:
+            self.update_many(updates)
+
         if len(deletions) > 0:
             self._remove(deletions)
 
@@ -89,9 +94,7 @@ class AbstractStorageInterface(ffd.LoggerAware, ABC):
         pass
 
     def _get_field_definition(self, entity: Type[ffd.Entity], name: str):
-        for field_ in fields(entity):
-            if field_.name == name:
-                return field_
+        return entity.__dataclass_fields__.get(name)
 
     def update(self, entity: ffd.Entity):
         self._check_prerequisites(entity.__class__)
@@ -103,6 +106,25 @@ class AbstractStorageInterface(ffd.LoggerAware, ABC):
     def _update(self, entity: ffd.Entity):
         pass
 
+    def update_many(self, entities: List[ffd.Entity], stop_on_conflict: bool = False) -> list:
+        if len(entities) == 0:
+            return []
+        self._check_prerequisites(entities[0].__class__)
+        now = datetime.now()
+        for entity in entities:
+            if hasattr(entity, 'updated_on'):
+                entity.updated_on = now
+        return self._update_many(entities, stop_on_conflict)
+
+    def _update_many(self, entities: List[ffd.Entity], stop_on_conflict: bool = False) -> list:
+        ret = []
+        for entity in entities:
+            result = self._update(entity)
+            ret.append(result)
+            if stop_on_conflict and result == 0:
+                break
+        return ret
+
     @abstractmethod
     def _ensure_connected(self):
         pass
@@ -122,9 +144,34 @@ class AbstractStorageInterface(ffd.LoggerAware, ABC):
     def _build_entity(self, entity: Type[ffd.Entity], data, raw: bool = False):
         pass
 
+    def _memoize(self, name: str, entity: Type[ffd.Entity], cb: Callable):
+        # Cached per instance: the computed values depend on settings such as _map_all and _map_indexes.
+        if self._reflection_cache is None:
+            self._reflection_cache = {}
+        key = (name, entity)
+        try:
+            return self._reflection_cache[key]
+        except KeyError:
+            ret = self._reflection_cache[key] = cb(entity)
+            return ret
+
+    def _get_type_hints(self, entity: Type[ffd.Entity]) -> dict:
+        return self._memoize('type_hints', entity, get_type_hints)
+
+    def _get_indexed_field_names(self, entity: Type[ffd.Entity]) -> List[str]:
+        return self._memoize('indexed_field_names', entity, lambda e: [
+            f.name for f in fields(e) if f.metadata.get('index') is True or f.metadata.get('id') is True
+        ])
+
     def _get_relationships(self, entity: Type[ffd.Entity]):
+        return self._memoize('relationships', entity, self._compute_relationships)
+
+    def _get_relationship_field_names(self, entity: Type[ffd.Entity]) -> List[str]:
+        return self._memoize('relationship_field_names', entity, lambda e: list(self._get_relationships(e).keys()))
+
+    def _compute_relationships(self, entity: Type[ffd.Entity]):
         relationships = {}
-        annotations_ = get_type_hints(entity)
+        annotations_ = self._get_type_hints(entity)
         for k, v in annotations_.items():
             if k.startswith('_'):
                 continue
@@ -181,8 +228,8 @@ class AbstractStorageInterface(ffd.LoggerAware, ABC):
 
     def _serialize_entity(self, entity: ffd.Entity, add_new: bool = False):
         relationships = self._get_relationships(entity.__class__)
-        if len(relationships.keys()) > 0:
-            obj = entity.to_dict(force_all=True, skip=list(relationships.keys()))
+        if len(relationships) > 0:
+            obj = entity.to_dict(force_all=True, skip=self._get_relationship_field_names(entity.__class__))
             for k, v in relationships.items():
                 if v['this_side'] == 'one':
                     try:
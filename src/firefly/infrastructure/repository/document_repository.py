@@ -208,9 +208,10 @@ class DocumentRepository(AbstractRepository[T]):
             self.debug('Adding %s', new_entities)
             self._interface.add(new_entities)
 
-        for entity in self._changed_entities():
-            self.debug('Updating %s', entity)
-            self._interface.update(entity)
+        changed_entities = self._changed_entities()
+        if len(changed_entities) > 0:
+            self.debug('Updating %s', changed_entities)
+            self._interface.update_many(changed_entities)
         self.debug('Done in commit()')
 
     def __repr__(self):
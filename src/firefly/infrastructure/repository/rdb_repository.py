@@ -218,9 +218,10 @@ class RdbRepository(AbstractRepository[T]):
                 if self._interface.add(batch) != len(batch):
                     raise ffd.ConcurrentUpdateDetected()
 
-        for entity in self._changed_entities():
-            self.debug('Updating %s', entity)
-            if self._interface.update(entity) == 0:
+        changed_entities = self._changed_entities()
+        if len(changed_entities) > 0:
+            self.debug('Updating %s', changed_entities)
+            if 0 in self._interface.update_many(changed_entities, stop_on_conflict=True):
                 raise ffd.ConcurrentUpdateDetected()
         self.debug('Done in commit()')
 
@@ -14,11 +14,10 @@
 
 from __future__ import annotations
 
-import inspect
 from abc import ABC, abstractmethod
 from dataclasses import fields
 from pprint import pprint
-from typing import Type, get_type_hints, List, Union, Callable, Dict, Tuple
+from typing import Type, List, Union, Callable, Dict, Tuple, Optional
 
 import firefly.domain as ffd
 import inflection
@@ -40,9 +39,10 @@ class RdbStorageInterface(AbstractStorageInterface, ABC):
     _map_indexes = False
     _map_all = False
     _identifier_quote_char = '"'
+    _templates: dict = None
 
     def __init__(self, **kwargs):
-        self._tables_checked = []
+        self._tables_checked = set()
 
     def _add(self, entity: Union[ffd.Entity, List[ffd.Entity]]):
         entities = entity
@@ -60,8 +60,7 @@ class RdbStorageInterface(AbstractStorageInterface, ABC):
 
     def _generate_select(self, entity_type: Type[ffd.Entity], criteria: ffd.BinaryOp = None, limit: int = None,
                          offset: int = None, sort: Tuple[Union[str, Tuple[str, bool]]] = None, count: bool = False):
-        indexes = [f.name for f in fields(entity_type)
-                   if f.metadata.get('index') is True or f.metadata.get('id') is True]
+        indexes = self._get_indexed_field_names(entity_type)
         data = {
                 'columns': self._select_list(entity_type),
                 'count': count,
@@ -191,8 +190,11 @@ class RdbStorageInterface(AbstractStorageInterface, ABC):
         self._ensure_connected()
 
     def get_entity_columns(self, entity: Type[ffd.Entity]):
+        return self._memoize('columns', entity, self._compute_entity_columns)
+
+    def _compute_entity_columns(self, entity: Type[ffd.Entity]):
         ret = []
-        annotations_ = get_type_hints(entity)
+        annotations_ = self._get_type_hints(entity)
         for f in fields(entity):
             if f.name.startswith('_'):
                 continue
@@ -237,23 +239,26 @@ class RdbStorageInterface(AbstractStorageInterface, ABC):
         )
 
     def get_entity_indexes(self, entity: Type[ffd.Entity]):
+        return self._memoize('indexes', entity, self._compute_entity_indexes)
+
+    def _compute_entity_indexes(self, entity: Type[ffd.Entity]):
         ret = []
+        named = {}
         table = self._fqtn(entity).replace('.', '_')
         for field_ in fields(entity):
             if 'index' in field_.metadata:
+                unique = field_.metadata.get('unique', False) is True
                 if field_.metadata['index'] is True:
-                    ret.append(
-                        Index(table=table, columns=[field_.name], unique=field_.metadata.get('unique', False) is True)
-                    )
+                    ret.append(Index(table=table, columns=[field_.name], unique=unique))
                 elif isinstance(field_.metadata['index'], str):
                     name = field_.metadata['index']
-                    idx = next(filter(lambda i: i.name == name, ret))
-                    if not idx:
-                        ret.append(Index(table=table, columns=[field_.name],
-                                         unique=field_.metadata.get('unique', False) is True))
+                    idx = named.get(name)
+                    if idx is None:
+                        idx = named[name] = Index(name=name, table=table, columns=[field_.name], unique=unique)
+                        ret.append(idx)
                     else:
                         idx.columns.append(field_.name)
-                        if field_.metadata.get('unique', False) is True and idx.unique is False:
+                        if unique and idx.unique is False:
                             idx.unique = True
 
         return ret
@@ -290,8 +295,10 @@ class RdbStorageInterface(AbstractStorageInterface, ABC):
                 self._do_register_entity(val)
                 self._register_aggregate_references(val)
             else:
-                list(map(self._do_register_entity, val or []))
-                list(map(self._register_aggregate_references, val or []))
+                for e in val or []:
+                    self._do_register_entity(e)
+                for e in val or []:
+                    self._register_aggregate_references(e)
 
     def _do_register_entity(self, entity):
         if isinstance(entity, ffd.AggregateRoot):
@@ -341,27 +348,38 @@ class RdbStorageInterface(AbstractStorageInterface, ABC):
         params = params or {}
         if isinstance(entity, list):
             entity = entity[0]
-        if not inspect.isclass(entity):
+        if not isinstance(entity, type):
             entity = entity.__class__
 
-        def mapped_fields(e):
-            return self.get_entity_columns(e)
+        data = self._memoize('query_context', entity, self._compute_query_context).copy()
+        data['mapped_fields'] = self.get_entity_columns
+        data.update(params)
+        sql, params = self._j.prepare_query(self._get_template(template), data)
+
+        return " ".join(sql.split()), params
 
-        template = self._j.env.select_template([template, '/'.join(['sql', template.split('/')[1]])])
-        data = {
+    def _compute_query_context(self, entity: Type[ffd.Entity]):
+        return {
             'fqtn': self._fqtn(entity),
             '_q': self._identifier_quote_char,
             'map_indexes': self._map_indexes,
             'map_all': self._map_all,
-            'mapped_fields': mapped_fields,
-            'indexes': list(map(lambda e: e.name, self.get_entity_indexes(entity))),
+            'indexes': [e.name for e in self.get_entity_indexes(entity)],
             'ids': entity.id_name() if isinstance(entity.id_name(), list) else [entity.id_name()],
             'field_types': {f.name: f.type for f in fields(entity)},
         }
-        data.update(params)
-        sql, params = self._j.prepare_query(template, data)
 
-        return " ".join(sql.split()), params
+    def _get_template(self, template: str):
+        # Cached per instance: select_template() re-checks the template file on disk for every lookup.
+        if self._templates is None:
+            self._templates = {}
+        try:
+            return self._templates[template]
+        except KeyError:
+            ret = self._templates[template] = self._j.env.select_template(
+                [template, '/'.join(['sql', template.split('/')[1]])]
+            )
+            return ret
 
     def create_table(self, entity_type: Type[ffd.Entity]):
         self.execute(
@@ -383,46 +401,80 @@ class RdbStorageInterface(AbstractStorageInterface, ABC):
 
     def _data_fields(self, entity: ffd.Entity, add_new: bool = False):
         ret = {}
-        for f in self.get_entity_columns(entity.__class__):
-            if f.name == 'document' and not hasattr(entity, 'document'):
-                ret[f.name] = self._serialize_entity(entity, add_new=add_new)
-            elif f.name == 'version':
+        for write in self._memoize('data_fields', entity.__class__, self._compile_data_fields):
+            write(self, entity, ret, add_new)
+        return ret
+
+    def _compile_data_fields(self, entity: Type[ffd.Entity]) -> List[Callable]:
+        ret = []
+        for column in self.get_entity_columns(entity):
+            write = self._compile_data_field(column)
+            if write is not None:
+                ret.append(write)
+        return ret
+
+    @staticmethod
+    def _compile_data_field(column: Column) -> Optional[Callable]:
+        name = column.name
+        type_ = column.type
+        write = None
+
+        if name == 'version':
+            def write(self, entity, ret, add_new):
                 try:
                     ret['version'] = getattr(entity, '__ff_version')
                 except AttributeError:
                     ret['version'] = 1
-            elif inspect.isclass(f.type) and issubclass(f.type, ffd.AggregateRoot):
+            return write
+
+        if isinstance(type_, type) and ffd.AggregateRoot in type_.__mro__:
+            is_required = column.is_required
+
+            def write(self, entity, ret, add_new):
                 try:
-                    ret[f.name] = getattr(entity, f.name).id_value()
+                    ret[name] = getattr(entity, name).id_value()
                 except AttributeError:
-                    if f.is_required:
-                        raise ffd.RepositoryError(f"{f.name} is a required field, but no value is present.")
-                    ret[f.name] = None
-            elif ffd.is_type_hint(f.type):
-                origin = ffd.get_origin(f.type)
-                args = ffd.get_args(f.type)
-                if origin is List:
-                    if issubclass(args[0], ffd.AggregateRoot):
-                        ret[f.name] = self._serializer.serialize(
-                            list(map(lambda e: e.id_value(), getattr(entity, f.name)))
-                        )
-                    else:
-                        ret[f.name] = self._serializer.serialize(getattr(entity, f.name))
-                elif origin is Dict:
-                    if issubclass(args[1], ffd.AggregateRoot):
-                        ret[f.name] = {k: v.id_value() for k, v in getattr(entity, f.name).items()}
-                    else:
-                        ret[f.name] = self._serializer.serialize(getattr(entity, f.name))
-            elif f.type is list or f.type is dict:
-                if hasattr(entity, f.name):
-                    ret[f.name] = self._serializer.serialize(getattr(entity, f.name))
-            else:
-                ret[f.name] = getattr(entity, f.name)
-                if isinstance(ret[f.name], ffd.ValueObject):
-                    ret[f.name] = self._serializer.serialize(ret[f.name])
-        return ret
+                    if is_required:
+                        raise ffd.RepositoryError(f"{name} is a required field, but no value is present.")
+                    ret[name] = None
+        elif ffd.is_type_hint(type_):
+            origin = ffd.get_origin(type_)
+            args = ffd.get_args(type_)
+            if origin is List and ffd.AggregateRoot in getattr(args[0], '__mro__', ()):
+                def write(self, entity, ret, add_new):
+                    ret[name] = self._serializer.serialize([e.id_value() for e in getattr(entity, name)])
+            elif origin is Dict and ffd.AggregateRoot in getattr(args[1], '__mro__', ()):
+                def write(self, entity, ret, add_new):
+                    ret[name] = {k: v.id_value() for k, v in getattr(entity, name).items()}
+            elif origin is List or origin is Dict:
+                def write(self, entity, ret, add_new):
+                    ret[name] = self._serializer.serialize(getattr(entity, name))
+        elif type_ is list or type_ is dict:
+            def write(self, entity, ret, add_new):
+                if hasattr(entity, name):
+                    ret[name] = self._serializer.serialize(getattr(entity, name))
+        else:
+            def write(self, entity, ret, add_new):
+                value = getattr(entity, name)
+                if isinstance(value, ffd.ValueObject):
+                    value = self._serializer.serialize(value)
+                ret[name] = value
+
+        if name == 'document':
+            fallback = write
+
+            def write(self, entity, ret, add_new):
+                if not hasattr(entity, 'document'):
+                    ret['document'] = self._serialize_entity(entity, add_new=add_new)
+                elif fallback is not None:
+                    fallback(self, entity, ret, add_new)
+
+        return write
 
     def _select_list(self, entity: Type[ffd.Entity]):
+        return self._memoize('select_list', entity, self._compute_select_list)
+
+    def _compute_select_list(self, entity: Type[ffd.Entity]):
         if self._map_all:
-            return list(map(lambda c: c.name, self.get_entity_columns(entity)))
+            return [c.name for c in self.get_entity_columns(entity)]
         return ['document', 'version']
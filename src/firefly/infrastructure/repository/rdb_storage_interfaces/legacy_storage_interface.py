@@ -15,9 +15,8 @@
 from __future__ import annotations
 
 from abc import abstractmethod, ABC
-from dataclasses import fields
 from pprint import pprint
-from typing import Type, Tuple, Union, List, get_type_hints, Dict
+from typing import Type, Tuple, Union, List, Dict
 
 import firefly.domain as ffd
 from firefly.infrastructure.repository.rdb_repository import DEFAULT_LIMIT
@@ -30,8 +29,7 @@ class LegacyStorageInterface(RdbStorageInterface, ffd.LoggerAware, ABC):
     def _generate_select(self, entity_type: Type[ffd.Entity], criteria: ffd.BinaryOp = None, limit: int = None,
                          offset: int = None, sort: Tuple[Union[str, Tuple[str, bool]]] = None, count: bool = False):
         pruned_criteria = None
-        indexes = [f.name for f in fields(entity_type)
-                   if f.metadata.get('index') is True or f.metadata.get('id') is True]
+        indexes = self._get_indexed_field_names(entity_type)
         if criteria is not None:
             pruned_criteria = criteria.prune(indexes)
             data = {
@@ -88,8 +86,7 @@ class LegacyStorageInterface(RdbStorageInterface, ffd.LoggerAware, ABC):
             if count:
                 ret = len(ret)
 
-        indexes = [f.name for f in fields(entity_type)
-                   if f.metadata.get('index') is True or f.metadata.get('id') is True]
+        indexes = self._get_indexed_field_names(entity_type)
         sorted_in_db = False
 
         if sort is not None:
@@ -121,22 +118,23 @@ class LegacyStorageInterface(RdbStorageInterface, ffd.LoggerAware, ABC):
 
     def _build_entity(self, entity: Type[ffd.Entity], data, raw: bool = False):
         if self._map_all is True:
-            types = get_type_hints(entity)
-            for k, v in data.items():
-                t = types[k]
-                if ffd.is_type_hint(t):
-                    if ffd.get_origin(t) is List:
-                        t = list
-                    elif ffd.get_origin(t) is Dict:
-                        t = dict
-                if isinstance(t, type) and issubclass(t, ffd.ValueObject):
-                    t = dict
-
-                if (t is dict or t is list) and isinstance(v, str):
-                    data[k] = self._serializer.deserialize(v)
+            for k in self._memoize('serialized_columns', entity, self._compute_serialized_columns):
+                if k in data and isinstance(data[k], str):
+                    data[k] = self._serializer.deserialize(data[k])
 
         return super()._build_entity(entity, data, raw)
 
+    def _compute_serialized_columns(self, entity: Type[ffd.Entity]) -> List[str]:
+        ret = []
+        for k, t in self._get_type_hints(entity).items():
+            if ffd.is_type_hint(t):
+                if ffd.get_origin(t) in (List, Dict):
+                    ret.append(k)
+            elif t is list or t is dict or (isinstance(t, type) and ffd.ValueObject in t.__mro__):
+                ret.append(k)
+
+        return ret
+
     @abstractmethod
     def _execute(self, sql: str, params: dict = None):
         pass
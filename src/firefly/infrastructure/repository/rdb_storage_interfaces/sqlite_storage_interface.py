@@ -38,7 +38,7 @@ class SqliteStorageInterface(LegacyStorageInterface, ffd.LoggerAware):
         if self._connection is not None:
             self._connection.close()
             self._connection = None
-            self._tables_checked = []
+            self._tables_checked = set()
 
     def _ensure_connected(self):
         if self._connection is not None:
@@ -15,18 +15,21 @@
 from __future__ import annotations
 
 import atexit
-import errno
 import importlib.util
 import os
 import signal
 import subprocess
-import sys
+import threading
+from pathlib import Path
 from typing import Optional
 
 import firefly.domain as ffd
 import firefly.infrastructure as ffi
 import inflection
 
+_WEBPACK_DONE = (b'Compiled successfully', b'Compiled with warnings')
+_WEB_MODULES = ('admin', 'app')
+
 
 class DefaultAgent(ffd.ApplicationService, ffd.LoggerAware):
     _web_server: ffi.WebServer = None
@@ -47,7 +50,9 @@ class DefaultAgent(ffd.ApplicationService, ffd.LoggerAware):
 
         if start_web_app:
             self.info('Starting web app')
-            self._start_web_app()
+            compiled = self._start_web_app()
+            if not start_server:
+                compiled.wait()
 
         if start_server:
             self._transaction_handler.reset_level()
@@ -75,11 +80,11 @@ class DefaultAgent(ffd.ApplicationService, ffd.LoggerAware):
                         route = f'{prefix}{route}'
                     web_server.add_endpoint(endpoint.method, route, endpoint.message)
 
-    def _start_web_app(self):
+    def _start_web_app(self) -> threading.Event:
         self._compile_web_app()
-        cmd = './node_modules/.bin/webpack-dev-server -w --mode development --env local'
+        cmd = ['./node_modules/.bin/webpack-dev-server', '-w', '--mode', 'development', '--env', 'local']
         webpack = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True, bufsize=0
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, start_new_session=True
         )
 
         def stop_webpack(a=None, b=None):
@@ -92,53 +97,45 @@ class DefaultAgent(ffd.ApplicationService, ffd.LoggerAware):
         signal.signal(signal.SIGTERM, stop_webpack)
         signal.signal(signal.SIGINT, stop_webpack)
 
-        while True:
-            output = webpack.stdout.readline()
-            if output:
-                print(output.decode().rstrip())
-                if 'Compiled successfully' in output.decode() or 'Compiled with warnings' in output.decode():
-                    break
-            if webpack.poll() is not None:
-                break
-            sys.stdout.flush()
+        # Relay webpack's output in the background so the web server can start while webpack compiles.
+        compiled = threading.Event()
+        threading.Thread(target=self._relay_webpack_output, args=(webpack, compiled), daemon=True).start()
+
+        return compiled
+
+    @staticmethod
+    def _relay_webpack_output(webpack: subprocess.Popen, compiled: threading.Event):
+        for output in iter(webpack.stdout.readline, b''):
+            print(output.decode().rstrip(), flush=True)
+            if _WEBPACK_DONE[0] in output or _WEBPACK_DONE[1] in output:
+                compiled.set()
+        compiled.set()
 
     def _compile_web_app(self):
         modules = []
-        for name, context in self._config.contexts.items():
-            module_name = f'{name}_web.admin'
-            if importlib.util.find_spec(module_name) is not None:
-                modules.append(module_name)
-            module_name = f'{name}_web.app'
-            if importlib.util.find_spec(module_name) is not None:
-                modules.append(module_name)
+        for name in self._config.contexts:
+            package = f'{name}_web'
+            if importlib.util.find_spec(package) is None:
+                continue
+            for suffix in _WEB_MODULES:
+                module_name = f'{package}.{suffix}'
+                if importlib.util.find_spec(module_name) is not None:
+                    modules.append(module_name)
 
         self._create_build_files(modules)
         self._transpile('build.entry')
 
     @staticmethod
     def _create_build_files(modules: list):
-        try:
-            os.mkdir('build')
-        except OSError as e:
-            if e.errno != errno.EEXIST:
-                raise
-
-        with open('build/app.py', 'w') as fp:
-            for module in modules:
-                if '_web.app' in module:
-                    fp.write(f'import {module}\n')
-
-        with open('build/admin.py', 'w') as fp:
-            fp.write('import firefly_web.app\n')
-            for module in modules:
-                if '_web.admin' in module:
-                    fp.write(f'import {module}\n')
-
-        with open('build/entry.py', 'w') as fp:
-            fp.write('import build.app\n')
-            fp.write('import build.admin\n')
+        build = Path('build')
+        build.mkdir(exist_ok=True)
+
+        app = ''.join(f'import {module}\n' for module in modules if '_web.app' in module)
+        admin = ''.join(f'import {module}\n' for module in modules if '_web.admin' in module)
+        (build / 'app.py').write_text(app)
+        (build / 'admin.py').write_text(f'import firefly_web.app\n{admin}')
+        (build / 'entry.py').write_text('import build.app\nimport build.admin\n')
 
     def _transpile(self, module_name: str):
-        cmd = f'. ./venv/bin/activate && ' \
-              f'./venv/bin/python3 -m transcrypt --nomin --map --fcall --verbose "{module_name}"'
-        self.info(os.system(cmd))
+        cmd = ['./venv/bin/python3', '-m', 'transcrypt', '--nomin', '--map', '--fcall', '--verbose', module_name]
+        self.info(subprocess.run(cmd).returncode)
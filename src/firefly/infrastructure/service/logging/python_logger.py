@@ -26,50 +26,62 @@ class PythonLogger(ffd.Logger):
     def __init__(self):
         self.log = logging
         self.log.basicConfig(format=f'%(message).{self._max_length}s', level=self.log.WARNING)
+        self._logger = logging.getLogger()
 
     def debug(self, message: str, *args, **kwargs):
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         if isinstance(message, dict):
             message = self._serializer.serialize(message)
-        self.log.debug(message, *args, **kwargs)
+        self._logger.debug(message, *args, **kwargs)
 
     def info(self, message: str, *args, **kwargs):
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         if isinstance(message, dict):
             message = self._serializer.serialize(message)
-        self.log.info(message, *args, **kwargs)
+        self._logger.info(message, *args, **kwargs)
 
     def warning(self, message: str, *args, **kwargs):
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return
         if isinstance(message, dict):
             message = self._serializer.serialize(message)
-        self.log.warning(message, *args, **kwargs)
+        self._logger.warning(message, *args, **kwargs)
 
     def error(self, message: str, *args, **kwargs):
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         if isinstance(message, dict):
             message = self._serializer.serialize(message)
-        self.log.error(message, *args, **kwargs)
+        self._logger.error(message, *args, **kwargs)
 
     def exception(self, message: str, *args, **kwargs):
-        self.log.exception(message, *args, **kwargs)
+        self._logger.exception(message, *args, **kwargs)
 
     def set_level_to_fatal(self):
-        self.log.getLogger().setLevel(logging.FATAL)
+        self._logger.setLevel(logging.FATAL)
 
     def set_level_to_error(self):
-        self.log.getLogger().setLevel(logging.ERROR)
+        self._logger.setLevel(logging.ERROR)
 
     def set_level_to_warning(self):
-        self.log.getLogger().setLevel(logging.WARNING)
+        self._logger.setLevel(logging.WARNING)
 
     def set_level_to_info(self):
-        self.log.getLogger().setLevel(logging.INFO)
+        self._logger.setLevel(logging.INFO)
 
     def set_level_to_debug(self):
-        self.log.getLogger().setLevel(logging.DEBUG)
+        self._logger.setLevel(logging.DEBUG)
 
     def disable(self):
-        self.log.getLogger().setLevel(logging.NOTSET)
+        self._logger.setLevel(logging.NOTSET)
 
     def get_level(self):
-        return self.log.getLogger().getEffectiveLevel()
+        return self._logger.getEffectiveLevel()
 
     def set_level(self, level: int):
-        self.log.getLogger().setLevel(level)
+        self._logger.setLevel(level)
+
+    def is_debug_enabled(self) -> bool:
+        return self._logger.isEnabledFor(logging.DEBUG)
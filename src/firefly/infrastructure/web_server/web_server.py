@@ -23,9 +23,7 @@ from typing import Callable, Dict
 from urllib.parse import parse_qsl
 
 import aiohttp
-import aiohttp_cors
 import firefly.domain as ffd
-import websockets
 from aiohttp import web, BodyPartReader
 from firefly import TypeOfMessage
 from firefly.domain.entity.messaging.http_response import HttpResponse
@@ -46,7 +44,8 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
     _rest_router: ffd.RestRouter = None
 
     def __init__(self, host: str = '0.0.0.0', port: int = 9000,
-                 websocket_host: str = '0.0.0.0', websocket_port: int = 9001):
+                 websocket_host: str = '0.0.0.0', websocket_port: int = 9001, backlog: int = 2048,
+                 reuse_port: bool = False, max_concurrent_requests: int = 256):
         self.routes = []
         self.extensions = []
         self.queues: Dict[str, asyncio.Queue] = {}
@@ -60,14 +59,24 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
             self.host = ':'.join(parts)
         self.websocket_host = websocket_host
         self.websocket_port = websocket_port
+        self.backlog = backlog
+        self.reuse_port = reuse_port
+        self.max_concurrent_requests = max_concurrent_requests
+        self._request_semaphore = None
         self.app = None
-        self.loop = asyncio.new_event_loop()
+        try:
+            import uvloop
+            self.loop = uvloop.new_event_loop()
+        except ModuleNotFoundError:
+            self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
 
     def add_extension(self, extension: Callable):
         self.extensions.append(extension)
 
     def run(self):
+        import websockets
+
         self.initialize()
 
         self.loop.run_until_complete(
@@ -75,11 +84,15 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
         )
 
         print(f"Server is running on {self.host}:{self.port}", flush=True)
-        web.run_app(self.app, host=self.host, port=self.port)
+        web.run_app(
+            self.app, host=self.host, port=self.port, backlog=self.backlog, reuse_port=self.reuse_port, loop=self.loop
+        )
 
         self._shut_down()
 
     def initialize(self):
+        import aiohttp_cors
+
         self.app = web.Application()
         self._init_logger()
 
@@ -145,11 +158,16 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
                     else:
                         request_data[part.name] = await part.text()
 
-            self.debug('Got a request -----------------------')
-            self.debug(request.headers)
-            self.debug(await request.text())
-            self.debug('-------------------------------------')
+            text = await request.text()
 
+            debug = self._logger.is_debug_enabled()
+            if debug:
+                self.debug('Got a request -----------------------')
+                self.debug(request.headers)
+                self.debug(text)
+                self.debug('-------------------------------------')
+
+            method = request.method.lower()
             endpoint, params = self._rest_router.match(request.path, request.method)
             if endpoint is not None:
                 if endpoint.message is not None:
@@ -158,34 +176,31 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
                     message_name = endpoint.service
                     if inspect.isclass(message_name):
                         message_name = message_name.get_fqn()
-                if request.method.lower() == 'get':
+                if method == 'get':
                     params.update(request.query)
                     message = self._message_factory.query(message_name, None, params)
                 else:
                     if multipart:
                         params.update(request_data)
-                    else:
-                        text = await request.text()
-                        if text and len(text):
-                            params.update(self._serializer.deserialize(text))
+                    elif text:
+                        params.update(self._serializer.deserialize(text))
                     message = self._message_factory.command(message_name, params)
             else:
                 if msg is not None:
                     message_name = msg
                     if inspect.isclass(msg):
                         message_name = message_name.get_fqn()
-                    if request.method.lower() == 'get':
+                    if method == 'get':
                         message = self._message_factory.query(message_name, None, dict(request.query))
-                    elif request.method.lower() == 'post':
-                        data = await request.text()
+                    elif method == 'post':
                         try:
-                            data = dict(self._serializer.deserialize(data))
+                            data = dict(self._serializer.deserialize(text))
                         except ffd.InvalidArgument:
-                            data = dict(parse_qsl(data))
+                            data = dict(parse_qsl(text))
                         data.update(dict(request.query))
                         message = self._message_factory.command(message_name, data)
-                elif request.method.lower() == 'post':
-                    message: ffd.Message = self._serializer.deserialize(await request.text())
+                elif method == 'post':
+                    message: ffd.Message = self._serializer.deserialize(text)
                 else:
                     message: ffd.Message = self._serializer.deserialize(request.query['query'])
 
@@ -197,18 +212,20 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
                         message_name = endpoint.service
                         if inspect.isclass(message_name):
                             message_name = message_name.get_fqn()
-                    if request.method.lower() == 'get':
+                    if method == 'get':
                         message = self._message_factory.query(message_name, None, message)
                     else:
                         message = self._message_factory.command(message_name, message)
 
-            self.debug(f'Decoded message: {message.to_dict()}')
+            if debug:
+                self.debug('Decoded message: %s', message.to_dict())
 
             try:
                 message.headers['client_id'] = request.headers['Firefly-Client-ID']
             except KeyError:
                 message.headers['client_id'] = ''
-                self.info('Request missing header Firefly-ClientID')
+                if debug:
+                    self.debug('Request missing header Firefly-ClientID')
 
             response = None
 
@@ -233,7 +250,8 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
                 response = str(e)
                 status_code = STATUS_CODES[e.__class__.__name__]
 
-            self.debug(f'Response: {response}')
+            if debug:
+                self.debug('Response: %s', response)
 
             if isinstance(response, HttpResponse):
                 body = response.body
@@ -253,17 +271,30 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
                     if 'unit' in range_:
                         headers['content-range'] = f'{range_["unit"]} {headers["content-range"]}'
                     status_code = 206
+            elif hasattr(response, '__aiter__'):
+                body = response
+                headers = {}
             else:
                 body = self._serializer.serialize(response)
                 headers = {}
 
+            if hasattr(body, '__aiter__'):
+                return await self._stream_response(request, body, headers, status_code)
+
             params = {'body': body, 'headers': headers}
             if status_code:
                 params['status'] = status_code
 
             return web.Response(**params)
 
-        return _handle_request
+        async def _limit_concurrency(request: web.Request):
+            # Created lazily so the semaphore belongs to the loop that serves requests.
+            if self._request_semaphore is None:
+                self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            async with self._request_semaphore:
+                return await _handle_request(request)
+
+        return _limit_concurrency
 
     @staticmethod
     async def _marshal_request(message: ffd.Message, request: web.Request, endpoint: ffd.HttpEndpoint):
@@ -284,6 +315,19 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
             message.headers['secured'] = endpoint.secured
             message.headers['scopes'] = endpoint.scopes
 
+    @staticmethod
+    async def _stream_response(request: web.Request, body, headers: dict, status_code: int = None):
+        # A chunked response can't also declare its length.
+        headers = {k: v for k, v in (headers or {}).items() if k.lower() != 'content-length'}
+        response = web.StreamResponse(status=status_code or 200, headers=headers)
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        async for chunk in body:
+            await response.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        await response.write_eof()
+
+        return response
+
     async def _handle_websocket(self, websocket, path):
         id_ = str(uuid.uuid4())
         consumer_task = asyncio.ensure_future(self._consumer(websocket, path, id_))
@@ -320,5 +364,7 @@ class WebServer(ffd.SystemBusAware, ffd.LoggerAware):
 
     def _shut_down(self):
         print("Shutting down")
-        self.loop.stop()
-        self.loop.close()
+        # web.run_app closes the loop it serves on when it returns.
+        if not self.loop.is_closed():
+            self.loop.stop()
+            self.loop.close()
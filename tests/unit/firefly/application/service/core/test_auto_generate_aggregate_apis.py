@@ -0,0 +1,57 @@
+#  Copyright (c) 2019 JD Williams
+#
+#  This file is part of Firefly, a Python SOA framework built by JD Williams. Firefly is free software; you can
+#  redistribute it and/or modify it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation; either version 3 of the License, or (at your option) any later version.
+#
+#  Firefly is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+#  implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details. You should have received a copy of the GNU Lesser General Public
+#  License along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  You should have received a copy of the GNU General Public License along with Firefly. If not, see
+#  <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+import firefly_di as di
+import pytest
+from firefly.application.service.core.auto_generate_aggregate_apis import AutoGenerateAggregateApis
+
+
+def test_each_crud_listener_keeps_its_own_command(sut, context):
+    sut._register_crud_event_listener('todo.WidgetCreated', 'todo.CreateWidget', context)
+    sut._register_crud_event_listener('todo.WidgetDeleted', 'todo.DeleteWidget', context)
+
+    registered = sut._event_resolving_middleware.listeners
+    assert [(listener._command_name, event) for listener, event in registered] == [
+        ('todo.CreateWidget', 'todo.WidgetCreated'),
+        ('todo.DeleteWidget', 'todo.WidgetDeleted'),
+    ]
+    assert sorted(context.event_listeners.values()) == [['todo.WidgetCreated'], ['todo.WidgetDeleted']]
+
+
+class FakeEventResolvingMiddleware:
+    def __init__(self):
+        self.listeners = []
+
+    def add_event_listener(self, handler, event):
+        self.listeners.append((handler, event))
+
+
+class FakeContext:
+    def __init__(self):
+        self.event_listeners = {}
+
+
+@pytest.fixture()
+def context():
+    return FakeContext()
+
+
+@pytest.fixture()
+def sut():
+    ret = AutoGenerateAggregateApis()
+    ret._container = di.Container()
+    ret._event_resolving_middleware = FakeEventResolvingMiddleware()
+    return ret
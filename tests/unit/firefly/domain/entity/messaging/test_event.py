@@ -21,6 +21,20 @@ def test_event(sut):
     assert str(sut) == 'test_event.ThisEvent'
 
 
+def test_str_follows_context_changes(sut):
+    assert str(sut) == 'test_event.ThisEvent'
+    sut._context = 'other'
+    assert str(sut) == 'other.ThisEvent'
+
+
+def test_is_this(sut):
+    assert sut.is_this('test_event.ThisEvent')
+    assert not sut.is_this('test_event.OtherEvent')
+    assert sut.is_this(ThisEvent)
+    assert not sut.is_this(Event)
+    assert not sut.is_this(None)
+
+
 class ThisEvent(Event):
     foo: str = required()
 
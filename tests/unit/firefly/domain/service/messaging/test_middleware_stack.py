@@ -50,6 +50,12 @@ def test_empty(sut):
     assert sut(m) is m
 
 
+def test_handle_many(sut):
+    sut.add(MyMiddleware1())
+    messages = [MyMessage(), MyMessage()]
+    assert sut.handle_many(messages) == messages
+
+
 def test_replace(sut):
     sut.add(MyMiddleware1())
     sut.add(MyMiddleware2())
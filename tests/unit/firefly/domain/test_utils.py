@@ -33,3 +33,14 @@ def test_get_args():
     assert ff.get_args(typing.List[str]) == (str,)
     assert ff.get_args(typing.Dict[str, str]) == (str, str)
     assert ff.get_args(typing.Union[typing.List[str], str]) == (typing.List[str], str)
+
+
+def test_get_module_classes():
+    import types
+    module = types.ModuleType('foo')
+    module.Foo = type('Foo', (), {})
+    module.bar = 'bar'
+
+    classes = ff.get_module_classes(module)
+    assert classes == [module.Foo]
+    assert ff.get_module_classes(module) is classes
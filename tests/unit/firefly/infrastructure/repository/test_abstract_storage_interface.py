@@ -0,0 +1,114 @@
+#  Copyright (c) 2019 JD Williams
+#
+#  This file is part of Firefly, a Python SOA framework built by JD Williams. Firefly is free software; you can
+#  redistribute it and/or modify it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation; either version 3 of the License, or (at your option) any later version.
+#
+#  Firefly is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+#  implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details. You should have received a copy of the GNU Lesser General Public
+#  License along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  You should have received a copy of the GNU General Public License along with Firefly. If not, see
+#  <http://www.gnu.org/licenses/>.
+
+from datetime import datetime
+
+import firefly as ff
+import firefly.infrastructure as ffi
+import pytest
+
+
+class Widget(ff.AggregateRoot):
+    id: str = ff.id_()
+    name: str = ff.optional()
+    updated_on: datetime = ff.optional()
+    deleted_on: datetime = ff.optional()
+
+
+class Widgets(ffi.RdbRepository[Widget]):
+    pass
+
+
+class FakeStorageInterface(ffi.AbstractStorageInterface):
+    def __init__(self, results: list = None):
+        self.results = results or []
+        self.updated = []
+        self.removed = []
+
+    def _update(self, entity):
+        self.updated.append(entity)
+        return self.results.pop(0) if self.results else 1
+
+    def _remove(self, entity):
+        self.removed.extend(entity)
+
+    def _add(self, entity):
+        pass
+
+    def _all(self, entity_type, criteria=None, limit=None, offset=None, sort=None, raw=False, count=False):
+        pass
+
+    def _find(self, uuid, entity_type):
+        pass
+
+    def _ensure_connected(self):
+        pass
+
+    def clear(self, entity):
+        pass
+
+    def destroy(self, entity):
+        pass
+
+    def _build_entity(self, entity, data, raw=False):
+        pass
+
+
+def test_update_many_stamps_updated_on(sut):
+    widgets = [Widget(id='1'), Widget(id='2')]
+
+    assert sut.update_many(widgets) == [1, 1]
+    assert sut.updated == widgets
+    assert widgets[0].updated_on is not None
+    assert widgets[0].updated_on == widgets[1].updated_on
+
+
+def test_update_many_stops_on_conflict():
+    sut = FakeStorageInterface(results=[1, 0, 1])
+    widgets = [Widget(id='1'), Widget(id='2'), Widget(id='3')]
+
+    assert sut.update_many(widgets, stop_on_conflict=True) == [1, 0]
+    assert sut.updated == widgets[:2]
+
+
+def test_soft_delete_goes_through_update_many(sut):
+    soft = Widget(id='1')
+
+    sut.remove([soft])
+
+    assert soft.deleted_on is not None
+    assert soft.updated_on is not None
+    assert sut.updated == [soft]
+    assert sut.removed == []
+
+
+def test_repository_commit_stops_at_first_conflict():
+    interface = FakeStorageInterface(results=[1, 0, 1])
+    repository = Widgets(interface=interface)
+    repository._serializer = ffi.JsonSerializer()
+    repository._logger = ffi.PythonLogger()
+    widgets = [Widget(id='1'), Widget(id='2'), Widget(id='3')]
+    for widget in widgets:
+        repository.register_entity(widget)
+        widget.name = 'changed'
+
+    with pytest.raises(ff.ConcurrentUpdateDetected):
+        repository.commit()
+
+    assert interface.updated == widgets[:2]
+
+
+@pytest.fixture()
+def sut():
+    return FakeStorageInterface()
@@ -0,0 +1,48 @@
+#  Copyright (c) 2019 JD Williams
+#
+#  This file is part of Firefly, a Python SOA framework built by JD Williams. Firefly is free software; you can
+#  redistribute it and/or modify it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation; either version 3 of the License, or (at your option) any later version.
+#
+#  Firefly is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+#  implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details. You should have received a copy of the GNU Lesser General Public
+#  License along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  You should have received a copy of the GNU General Public License along with Firefly. If not, see
+#  <http://www.gnu.org/licenses/>.
+
+import firefly as ff
+import firefly.infrastructure.repository.rdb_storage_interfaces as rsi
+import pytest
+
+
+class Widget(ff.AggregateRoot):
+    id: str = ff.id_()
+    name: str = ff.optional(index=True)
+    a: str = ff.optional(index='widget_a_b')
+    b: str = ff.optional(index='widget_a_b', unique=True)
+
+
+def test_named_indexes_are_combined(sut):
+    indexes = sut.get_entity_indexes(Widget)
+
+    assert len(indexes) == 2
+    assert indexes[0].columns == ['name']
+    assert indexes[1].name == 'widget_a_b'
+    assert indexes[1].columns == ['a', 'b']
+    assert indexes[1].unique is True
+
+
+def test_reflection_is_cached_per_instance(sut):
+    mapped = rsi.SqliteStorageInterface(host=':memory:')
+    mapped._map_all = True
+
+    assert 'document' in [c.name for c in sut.get_entity_columns(Widget)]
+    assert [c.name for c in mapped.get_entity_columns(Widget)] == ['id', 'name', 'a', 'b']
+    assert mapped._select_list(Widget) == ['id', 'name', 'a', 'b']
+
+
+@pytest.fixture()
+def sut():
+    return rsi.SqliteStorageInterface(host=':memory:')
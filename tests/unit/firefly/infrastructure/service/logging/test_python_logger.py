@@ -0,0 +1,53 @@
+#  Copyright (c) 2019 JD Williams
+#
+#  This file is part of Firefly, a Python SOA framework built by JD Williams. Firefly is free software; you can
+#  redistribute it and/or modify it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation; either version 3 of the License, or (at your option) any later version.
+#
+#  Firefly is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+#  implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details. You should have received a copy of the GNU Lesser General Public
+#  License along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  You should have received a copy of the GNU General Public License along with Firefly. If not, see
+#  <http://www.gnu.org/licenses/>.
+
+import firefly.infrastructure as ffi
+import pytest
+
+
+class CountingSerializer:
+    def __init__(self):
+        self.calls = 0
+
+    def serialize(self, data):
+        self.calls += 1
+        return str(data)
+
+
+def test_suppressed_messages_are_not_serialized(sut: ffi.PythonLogger):
+    sut.set_level_to_error()
+    sut.debug({'foo': 'bar'})
+    sut.info({'foo': 'bar'})
+    sut.warning({'foo': 'bar'})
+    assert sut._serializer.calls == 0
+
+    sut.error({'foo': 'bar'})
+    assert sut._serializer.calls == 1
+
+
+def test_is_debug_enabled(sut: ffi.PythonLogger):
+    sut.set_level_to_info()
+    assert sut.is_debug_enabled() is False
+
+    sut.set_level_to_debug()
+    assert sut.is_debug_enabled() is True
+
+
+@pytest.fixture()
+def sut():
+    ret = ffi.PythonLogger()
+    ret._serializer = CountingSerializer()
+    level = ret.get_level()
+    yield ret
+    ret.set_level(level)
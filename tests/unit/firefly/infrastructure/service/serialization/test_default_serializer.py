@@ -12,9 +12,15 @@
 #  You should have received a copy of the GNU General Public License along with Firefly. If not, see
 #  <http://www.gnu.org/licenses/>.
 
+import enum
+import json
+import math
+import uuid
+
 import firefly.domain as ffd
 import firefly.infrastructure as ffi
 import pytest
+from firefly.infrastructure.service.serialization.default_serializer import FireflyEncoder
 
 
 class ThisCommand(ffd.Command):
@@ -32,6 +38,36 @@ def test_serialize_message(sut: ffi.JsonSerializer):
     assert deserialized.y == 0
 
 
+class Color(enum.Enum):
+    RED = 'red'
+
+
+def test_non_finite_floats_round_trip(sut: ffi.JsonSerializer):
+    data = sut.deserialize(sut.serialize({'nan': float('nan'), 'inf': float('inf')}))
+    assert math.isnan(data['nan'])
+    assert data['inf'] == float('inf')
+
+
+def test_large_ints_round_trip(sut: ffi.JsonSerializer):
+    assert sut.deserialize(sut.serialize({'x': 2 ** 70})) == {'x': 2 ** 70}
+    assert sut.deserialize('{"x": 12345678901234567890123}') == {'x': 12345678901234567890123}
+
+
+def test_tuple_keys_are_skipped(sut: ffi.JsonSerializer):
+    assert sut.deserialize(sut.serialize({('a', 'b'): 1, 'c': 2})) == {'c': 2}
+
+
+@pytest.mark.parametrize('value', [uuid.uuid4(), Color.RED])
+def test_unsupported_types_are_rejected(sut: ffi.JsonSerializer, value):
+    with pytest.raises(TypeError):
+        sut.serialize({'x': value})
+
+
+def test_output_matches_stdlib_json(sut: ffi.JsonSerializer):
+    data = {'a': [1, 2.5, None], 'b': {'c': 'd'}}
+    assert sut.serialize(data) == json.dumps(data, cls=FireflyEncoder, skipkeys=True)
+
+
 @pytest.fixture()
 def sut():
     return ffi.JsonSerializer()
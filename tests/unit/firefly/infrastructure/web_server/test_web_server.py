@@ -0,0 +1,97 @@
+#  Copyright (c) 2019 JD Williams
+#
+#  This file is part of Firefly, a Python SOA framework built by JD Williams. Firefly is free software; you can
+#  redistribute it and/or modify it under the terms of the GNU General Public License as published by the
+#  Free Software Foundation; either version 3 of the License, or (at your option) any later version.
+#
+#  Firefly is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the
+#  implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU General
+#  Public License for more details. You should have received a copy of the GNU Lesser General Public
+#  License along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  You should have received a copy of the GNU General Public License along with Firefly. If not, see
+#  <http://www.gnu.org/licenses/>.
+
+import asyncio
+
+import firefly as ff
+import firefly.domain as ffd
+import firefly.infrastructure as ffi
+import pytest
+import websockets
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+
+def test_app_is_served_on_server_loop(sut: ffi.WebServer, monkeypatch):
+    served_on = []
+
+    async def on_startup(app):
+        served_on.append(asyncio.get_event_loop())
+        raise web.GracefulExit()
+
+    def initialize():
+        sut.app = web.Application()
+        sut.app.on_startup.append(on_startup)
+
+    async def serve(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(sut, 'initialize', initialize)
+    monkeypatch.setattr(websockets, 'serve', serve)
+    sut.run()
+
+    assert served_on == [sut.loop]
+
+
+def test_uses_uvloop_when_installed(sut: ffi.WebServer):
+    uvloop = pytest.importorskip('uvloop')
+    assert isinstance(sut.loop, uvloop.Loop)
+
+
+async def chunks():
+    for chunk in ('foo', b'bar', 'baz'):
+        yield chunk
+
+
+class FakeRouter:
+    def match(self, route: str, method: str = 'get'):
+        return None, {}
+
+
+class FakeSystemBus:
+    def __init__(self, response):
+        self.response = response
+
+    def request(self, request, criteria=None, data=None):
+        return self.response
+
+
+def test_async_iterable_body_is_streamed(sut: ffi.WebServer):
+    response = ff.HttpResponse(body=chunks(), headers={'Content-Length': '3', 'Content-Type': 'text/plain; charset=utf-8'})
+    sut._logger = ffi.PythonLogger()
+    sut._serializer = ffi.JsonSerializer()
+    sut._message_factory = ffd.MessageFactory()
+    sut._rest_router = FakeRouter()
+    sut._system_bus = FakeSystemBus(response)
+
+    async def get():
+        app = web.Application()
+        app.router.add_get('/', sut._request_handler_generator('test_web_server.GetWidgets'))
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get('/')
+            return resp.status, resp.headers, await resp.text()
+
+    status, headers, text = sut.loop.run_until_complete(get())
+
+    assert status == 200
+    assert headers['Transfer-Encoding'] == 'chunked'
+    assert 'Content-Length' not in headers
+    assert text == 'foobarbaz'
+
+
+@pytest.fixture()
+def sut():
+    ret = ffi.WebServer(host='127.0.0.1', port=0)
+    yield ret
+    asyncio.set_event_loop(asyncio.new_event_loop())